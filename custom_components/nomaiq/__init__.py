@@ -17,7 +17,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CLIENT_ID, CLIENT_SECRET, NORMAL_UPDATE_INTERVAL
+from .const import (
+    CLIENT_ID,
+    CLIENT_SECRET,
+    CONF_FANOUT_LIMIT,
+    DEFAULT_FANOUT_LIMIT,
+    NORMAL_UPDATE_INTERVAL,
+)
 from .coordinator import NomaIQDataUpdateCoordinator
 
 _PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.COVER]
@@ -55,15 +61,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: NomaIQConfigEntry) -> bo
         logger=_LOGGER,
         update_interval=timedelta(seconds=NORMAL_UPDATE_INTERVAL),
         api=api,
+        fanout_limit=options.get(CONF_FANOUT_LIMIT, DEFAULT_FANOUT_LIMIT),
     )
     await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: NomaIQConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: NomaIQConfigEntry) -> bool:
     """Unload a config entry."""
 
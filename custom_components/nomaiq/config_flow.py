@@ -8,15 +8,26 @@ from typing import Any
 import ayla_iot_unofficial
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CLIENT_ID, CLIENT_SECRET, DOMAIN
+from .const import (
+    CLIENT_ID,
+    CLIENT_SECRET,
+    CONF_FANOUT_LIMIT,
+    DEFAULT_FANOUT_LIMIT,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +38,14 @@ CONFIG_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_FANOUT_LIMIT, default=DEFAULT_FANOUT_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -50,6 +69,26 @@ class NomaIQConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return NomaIQOptionsFlow()
+
+    async def _async_validate_errors(self, user_input: dict[str, Any]) -> dict[str, str]:
+        """Validate the user input and return the form errors, if any."""
+        errors: dict[str, str] = {}
+        try:
+            await validate_input(self.hass, user_input)
+        except ayla_iot_unofficial.AylaApiError:
+            errors["base"] = "cannot_connect"
+        except ayla_iot_unofficial.AylaAuthError:
+            errors["base"] = "invalid_auth"
+        except Exception:
+            _LOGGER.exception("Unexpected exception")
+            errors["base"] = "unknown"
+        return errors
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -59,16 +98,8 @@ class NomaIQConfigFlow(ConfigFlow, domain=DOMAIN):
         # Handle new configuration
         if user_input is not None:
             self._async_abort_entries_match({CONF_USERNAME: user_input[CONF_USERNAME]})
-            try:
-                await validate_input(self.hass, user_input)
-            except ayla_iot_unofficial.AylaApiError:
-                errors["base"] = "cannot_connect"
-            except ayla_iot_unofficial.AylaAuthError:
-                errors["base"] = "invalid_auth"
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-            else:
+            errors = await self._async_validate_errors(user_input)
+            if not errors:
                 return self.async_create_entry(title=DOMAIN, data=user_input)
 
         return self.async_show_form(
@@ -82,16 +113,8 @@ class NomaIQConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                await validate_input(self.hass, user_input)
-            except ayla_iot_unofficial.AylaApiError:
-                errors["base"] = "cannot_connect"
-            except ayla_iot_unofficial.AylaAuthError:
-                errors["base"] = "invalid_auth"
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-            else:
+            errors = await self._async_validate_errors(user_input)
+            if not errors:
                 # Update the existing entry with new data
                 entry = self.hass.config_entries.async_get_entry(
                     self.context["entry_id"]
@@ -108,3 +131,21 @@ class NomaIQConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={"username": entry.data[CONF_USERNAME]},
         )
+
+
+class NomaIQOptionsFlow(OptionsFlow):
+    """Handle options for nomaiq."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
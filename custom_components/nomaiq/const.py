@@ -7,3 +7,11 @@ CLIENT_SECRET = "ctc-noma-WNHWBmAGLoaMl8xq8lx9XxGmiTQ"
 # Update intervals
 NORMAL_UPDATE_INTERVAL = 30  # seconds
 TRANSITION_UPDATE_INTERVAL = 2  # seconds for devices opening/closing
+REQUEST_REFRESH_DELAY = 0.5  # seconds to coalesce requested refreshes
+
+# Maximum number of concurrent device refreshes against the Ayla cloud
+CONF_FANOUT_LIMIT = "fanout_limit"
+DEFAULT_FANOUT_LIMIT = 6
+
+# Window in which repeated garage door toggles are coalesced into one
+TOGGLE_DEBOUNCE_WINDOW = 0.2  # seconds
@@ -1,18 +1,82 @@
 """Coordinator for NomaIQ devices with responsive light updates."""
 
+import asyncio
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Set
+from typing import Any
 
+import aiohttp
 import ayla_iot_unofficial
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, NORMAL_UPDATE_INTERVAL, TRANSITION_UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    NORMAL_UPDATE_INTERVAL,
+    REQUEST_REFRESH_DELAY,
+    TRANSITION_UPDATE_INTERVAL,
+)
 
+_NORMAL_TD = timedelta(seconds=NORMAL_UPDATE_INTERVAL)
+_TRANSITION_TD = timedelta(seconds=TRANSITION_UPDATE_INTERVAL)
 
-class NomaIQDataUpdateCoordinator(
-    DataUpdateCoordinator[list[ayla_iot_unofficial.device.Device]]
-):
+# Responses meaning the cloud does not offer the batched datapoint endpoint
+_BATCH_UNSUPPORTED_STATUSES = frozenset({404, 405})
+
+
+def _match_batch_results(results: Any, names: dict[str, str]) -> dict[str, int] | None:
+    """Map batched datapoint results to property names and their statuses.
+
+    Returns None unless every result matches exactly one written datapoint and
+    every written datapoint has a result.
+    """
+    if not isinstance(results, list):
+        return None
+    statuses: dict[str, int] = {}
+    for result in results:
+        if not isinstance(result, dict):
+            return None
+        name = names.get(result.get("name"))
+        status = result.get("status")
+        if name is None or name in statuses or not isinstance(status, int):
+            return None
+        statuses[name] = status
+    return statuses if len(statuses) == len(names) else None
+
+
+@dataclass(slots=True)
+class TransitionState:
+    """Transition bookkeeping for a single device."""
+
+    intended_power: int | None = None
+    last_door_status: str | None = None
+
+
+@dataclass(slots=True)
+class NomaIQData:
+    """Devices from a poll, compared by their property values."""
+
+    devices: dict[str, ayla_iot_unofficial.device.Device] = field(compare=False)
+    states: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_devices(
+        cls, devices: dict[str, ayla_iot_unofficial.device.Device]
+    ) -> "NomaIQData":
+        """Build the data, snapshotting the current property values."""
+        return cls(
+            devices=devices,
+            states={
+                serial: {
+                    name: prop.get("value") for name, prop in device.properties_full.items()
+                }
+                for serial, device in devices.items()
+            },
+        )
+
+
+class NomaIQDataUpdateCoordinator(DataUpdateCoordinator[NomaIQData]):
     """Devices state update handler with responsive light handling."""
 
     def __init__(
@@ -21,14 +85,21 @@ class NomaIQDataUpdateCoordinator(
         logger,
         update_interval: timedelta,
         api: ayla_iot_unofficial.AylaApi,
+        fanout_limit: int,
     ) -> None:
         """Initialize global data updater."""
         self._api = api
-        self._devices_in_transition: Set[str] = set()  # Track devices in transition
+        # Track devices in transition and, for lights, their intended power
+        self._transitions: dict[str, TransitionState] = {}
         self._last_full_update = 0
+        # Current update interval in seconds, mirrored to avoid timedelta math
+        self._interval_seconds = update_interval.total_seconds()
 
-        # Track intended light states for optimistic transition
-        self._intended_light_states: dict[str, int] = {}
+        # Bound concurrent device refreshes to avoid hammering the cloud
+        self._update_semaphore = asyncio.Semaphore(fanout_limit)
+
+        # Cleared once the cloud rejects a batched datapoint write
+        self._batch_writes_supported = True
 
         super().__init__(
             hass,
@@ -36,6 +107,12 @@ class NomaIQDataUpdateCoordinator(
             name=DOMAIN,
             update_interval=update_interval,
             update_method=self._async_update_data,
+            # Only notify entities when a property value actually changed
+            always_update=False,
+            # Collapse refreshes requested by several entities into one
+            request_refresh_debouncer=Debouncer(
+                hass, logger, cooldown=REQUEST_REFRESH_DELAY, immediate=False
+            ),
         )
 
     @property
@@ -43,34 +120,151 @@ class NomaIQDataUpdateCoordinator(
         """Return the API instance."""
         return self._api
 
+    def get_device(self, device_serial: str) -> ayla_iot_unofficial.device.Device | None:
+        """Return the device with the given serial number, if known."""
+        return self.data.devices.get(device_serial)
+
+    async def async_set_device_properties(
+        self, device: ayla_iot_unofficial.device.Device, values: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Write several properties to a device in a single batch request.
+
+        The cloud gives no guarantee on the order the datapoints are applied in,
+        so only independent properties should be batched. Returns the values the
+        cloud accepted, or None when batched datapoints are unsupported or their
+        results cannot be read, in which case properties must be set one by one.
+        Setting them again is harmless if the batch was applied after all.
+        """
+        if not self._batch_writes_supported:
+            return None
+
+        # Cloud property names mapped back to ours, the results report the former
+        names: dict[str, str] = {}
+        datapoints: list[dict[str, Any]] = []
+        for name, value in values.items():
+            prop = device.properties_full.get(name, {})
+            # Same guard as Device.async_set_property_value
+            if prop.get("read_only"):
+                raise ayla_iot_unofficial.AylaReadOnlyPropertyError(
+                    f"{name} is read only"
+                )
+            cloud_name = prop.get("name", name)
+            names[cloud_name] = name
+            datapoints.append(
+                {
+                    "datapoint": {"value": value},
+                    "dsn": device.serial_number,
+                    "name": cloud_name,
+                }
+            )
+
+        payload = {"batch_datapoints": datapoints}
+        base_url = device.eu_ads_url if device.europe else device.ads_url
+        async with await self._api.async_request(
+            "post", f"{base_url}/apiv1/batch_datapoints.json", json=payload
+        ) as resp:
+            if resp.status in _BATCH_UNSUPPORTED_STATUSES:
+                self.logger.debug(
+                    "Batched datapoints rejected with status %s, using single writes",
+                    resp.status,
+                )
+                self._batch_writes_supported = False
+                return None
+            resp.raise_for_status()
+            try:
+                results = await resp.json()
+            except (aiohttp.ContentTypeError, ValueError):
+                results = None
+
+        statuses = _match_batch_results(results, names)
+        if statuses is None:
+            self.logger.warning(
+                "Unrecognized batched datapoints response for device %s, "
+                "using single writes: %s",
+                device.serial_number,
+                results,
+            )
+            self._batch_writes_supported = False
+            return None
+
+        # Each datapoint carries its own status, keep only the accepted ones
+        accepted: dict[str, Any] = {}
+        for name, status in statuses.items():
+            if 200 <= status < 300:
+                accepted[name] = values[name]
+            else:
+                self.logger.warning(
+                    "Failed to set %s on device %s, status %s",
+                    name,
+                    device.serial_number,
+                    status,
+                )
+        return accepted
+
+    @callback
+    def async_set_device_values(self, device_serial: str, values: dict[str, Any]) -> None:
+        """Store property values written to a device and notify entities."""
+        device = self.get_device(device_serial)
+        if device is None:
+            return
+        for name, value in values.items():
+            device.properties_full[name]["value"] = value
+        # Unlike async_set_updated_data, this keeps pending and scheduled refreshes
+        self.data = NomaIQData.from_devices(self.data.devices)
+        self.async_update_listeners()
+
     def set_device_transition_state(self, device_serial: str, in_transition: bool, intended_power: int | None = None) -> None:
         """Mark a device as in transition (faster polling)."""
         if in_transition:
-            self._devices_in_transition.add(device_serial)
+            state = self._transitions.setdefault(device_serial, TransitionState())
             if intended_power is not None:
-                self._intended_light_states[device_serial] = intended_power
-            if self.update_interval.total_seconds() != TRANSITION_UPDATE_INTERVAL:
-                self.update_interval = timedelta(seconds=TRANSITION_UPDATE_INTERVAL)
+                state.intended_power = intended_power
+            if self._interval_seconds != TRANSITION_UPDATE_INTERVAL:
+                self.update_interval = _TRANSITION_TD
+                self._interval_seconds = TRANSITION_UPDATE_INTERVAL
                 self.logger.debug(
                     "Switched to fast update interval for device %s", device_serial
                 )
         else:
-            self._devices_in_transition.discard(device_serial)
-            self._intended_light_states.pop(device_serial, None)
-            if not self._devices_in_transition and self.update_interval.total_seconds() != NORMAL_UPDATE_INTERVAL:
-                self.update_interval = timedelta(seconds=NORMAL_UPDATE_INTERVAL)
+            self._transitions.pop(device_serial, None)
+            if not self._transitions and self._interval_seconds != NORMAL_UPDATE_INTERVAL:
+                self.update_interval = _NORMAL_TD
+                self._interval_seconds = NORMAL_UPDATE_INTERVAL
                 self.logger.debug("Switched back to normal update interval")
 
     def is_device_in_transition(self, device_serial: str) -> bool:
         """Check if a device is currently in transition state."""
-        return device_serial in self._devices_in_transition
+        return device_serial in self._transitions
+
+    async def _async_update_device(self, device: ayla_iot_unofficial.device.Device) -> None:
+        """Refresh a single device, bounded by the update semaphore."""
+        async with self._update_semaphore:
+            await device.async_update()
 
-    async def _async_update_data(self) -> list[ayla_iot_unofficial.device.Device]:
+    async def _async_update_devices(
+        self, devices: list[ayla_iot_unofficial.device.Device]
+    ) -> list[BaseException | None]:
+        """Refresh devices concurrently and log the ones that failed."""
+        results = await asyncio.gather(
+            *(self._async_update_device(device) for device in devices),
+            return_exceptions=True,
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    "Failed to update device %s: %s", device.serial_number, result
+                )
+        return results
+
+    async def _async_update_data(self) -> NomaIQData:
         """Fetch data and handle transitions."""
         try:
-            # Ensure API authentication
+            # Ensure API authentication. Every request made by the API checks the
+            # token itself and fails once it is expiring soon, so only look
+            # closer once the token has entered that window.
             try:
-                self._api.check_auth()
+                if self._api.token_expiring_soon:
+                    self._api.check_auth()
             except ayla_iot_unofficial.AylaAuthExpiringError:
                 await self._api.async_refresh_auth()
             except Exception as ex:
@@ -78,51 +272,83 @@ class NomaIQDataUpdateCoordinator(
                 raise UpdateFailed("Failed to refresh auth") from ex
 
             devices = await self._api.async_get_devices()
+            previous = self.data.devices if self.data else {}
             current_time = self.hass.loop.time()
 
             is_full_update = (
-                self.update_interval.total_seconds() == NORMAL_UPDATE_INTERVAL
+                self._interval_seconds == NORMAL_UPDATE_INTERVAL
                 or current_time - self._last_full_update >= NORMAL_UPDATE_INTERVAL
             )
 
             if is_full_update:
                 # Full update: refresh all devices
                 self.logger.debug("Performing full update of all devices")
-                for device in devices:
-                    await device.async_update()
+                targets = devices
+                results = await self._async_update_devices(targets)
+                # Single devices may fail, but no device at all means an outage
+                if targets and all(isinstance(result, BaseException) for result in results):
+                    raise UpdateFailed(f"Failed to update all {len(targets)} devices")
                 self._last_full_update = current_time
             else:
-                # Transition update: only devices in transition
+                # Transition update: only devices in transition. Snapshot the dict
+                # as entities may add or remove devices while the refreshes are
+                # awaited. The TransitionState records are shared, not copied.
+                in_transit = self._transitions.copy()
                 self.logger.debug(
-                    "Performing transition update for %d devices", len(self._devices_in_transition)
+                    "Performing transition update for %d devices", len(in_transit)
                 )
-                for device in devices:
-                    if device.serial_number in self._devices_in_transition:
-                        await device.async_update()
-
-                        # Check light transitions
-                        if device.serial_number in self._intended_light_states:
-                            intended_power = self._intended_light_states[device.serial_number]
-                            current_power = device.get_property_value("power")
-                            if current_power == intended_power:
-                                self.set_device_transition_state(device.serial_number, False)
-                                self.logger.debug(
-                                    "Light %s transition completed, power=%s",
-                                    device.serial_number,
-                                    current_power,
-                                )
-
-                        # Check doors/shades transitions
-                        door_status = device.get_property_value("door_status")
-                        if door_status in ["opened", "closed"]:
+                targets = [device for device in devices if device.serial_number in in_transit]
+                # Devices gone from the account can never complete their transition
+                for serial in in_transit.keys() - {device.serial_number for device in targets}:
+                    self.set_device_transition_state(serial, False)
+                results = await self._async_update_devices(targets)
+                for device, result in zip(targets, results):
+                    if isinstance(result, BaseException):
+                        continue
+
+                    # Check light transitions. Lights have no door status, so a
+                    # single property read settles each device.
+                    state = in_transit[device.serial_number]
+                    intended_power = state.intended_power
+                    if intended_power is not None:
+                        current_power = device.get_property_value("power")
+                        if current_power == intended_power:
                             self.set_device_transition_state(device.serial_number, False)
                             self.logger.debug(
-                                "Device %s transition completed, status: %s",
+                                "Light %s transition completed, power=%s",
                                 device.serial_number,
-                                door_status,
+                                current_power,
                             )
+                        continue
+
+                    # Check doors/shades transitions, only when the status changed
+                    door_status = device.get_property_value("door_status")
+                    if door_status == state.last_door_status:
+                        continue
+                    state.last_door_status = door_status
+                    if door_status in ["opened", "closed"]:
+                        self.set_device_transition_state(device.serial_number, False)
+                        self.logger.debug(
+                            "Device %s transition completed, status: %s",
+                            device.serial_number,
+                            door_status,
+                        )
+
+            # The API returns new, empty device objects on every call. Keep the
+            # last refreshed copy of devices that were not refreshed this time.
+            refreshed = {
+                device.serial_number
+                for device, result in zip(targets, results)
+                if not isinstance(result, BaseException)
+            }
+            by_serial: dict[str, ayla_iot_unofficial.device.Device] = {}
+            for device in devices:
+                serial = device.serial_number
+                if serial not in refreshed and serial in previous:
+                    device = previous[serial]
+                by_serial[serial] = device
 
         except Exception as ex:
             raise UpdateFailed(f"Exception on getting states: {ex}") from ex
         else:
-            return devices
+            return NomaIQData.from_devices(by_serial)
@@ -5,7 +5,6 @@ from __future__ import annotations
 import time
 from typing import Any
 
-import ayla_iot_unofficial
 import ayla_iot_unofficial.device
 
 from homeassistant.components.cover import (
@@ -13,12 +12,13 @@ from homeassistant.components.cover import (
     CoverDeviceClass,
     CoverEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import NomaIQConfigEntry
-from .const import DOMAIN
+from .const import DOMAIN, TOGGLE_DEBOUNCE_WINDOW
 from .coordinator import NomaIQDataUpdateCoordinator
 
 
@@ -30,16 +30,20 @@ async def async_setup_entry(
     """Set up the Noma IQ Cover platform."""
     coordinator: NomaIQDataUpdateCoordinator = entry.runtime_data
 
-    for device in coordinator.data:
-        if device.oem_model_number == "gdo":
-            # Garage Door Opener
-            async_add_entities(
-                [NomaIQGarageDoorOpenerEntity(coordinator, device)],
-                update_before_add=False,
-            )
+    # Garage Door Openers
+    async_add_entities(
+        (
+            NomaIQGarageDoorOpenerEntity(coordinator, device)
+            for device in coordinator.data.devices.values()
+            if device.oem_model_number == "gdo"
+        ),
+        update_before_add=False,
+    )
 
 
-class NomaIQGarageDoorOpenerEntity(CoverEntity):
+class NomaIQGarageDoorOpenerEntity(
+    CoordinatorEntity[NomaIQDataUpdateCoordinator], CoverEntity
+):
     """Representation of a NomaIQ Garage Door Opener."""
 
     def __init__(
@@ -48,26 +52,29 @@ class NomaIQGarageDoorOpenerEntity(CoverEntity):
         device: ayla_iot_unofficial.device.Device,
     ) -> None:
         """Initialize a NomaIQ Garage Door Opener."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._device = device
+        self._serial: str = device.serial_number
         self._attr_device_class = CoverDeviceClass.GARAGE
         self._attr_supported_features = (
             CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
         )
         self._attr_name = device.name
-        self._attr_unique_id = f"nomaiq_cover_{device.serial_number}"
+        self._attr_unique_id = f"nomaiq_cover_{self._serial}"
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.serial_number)},
+            identifiers={(DOMAIN, self._serial)},
             name=device.name,
         )
 
+        # Door status read once per update and shared by the state properties
+        self._door_status: str | None = device.get_property_value("door_status")
+
+        # Loop time of the last door toggle sent, used to coalesce rapid presses
+        self._last_toggle_ts: float = 0.0
+
     def _get_current_device(self) -> ayla_iot_unofficial.device.Device | None:
         """Get the current device from coordinator data."""
-        data: list[ayla_iot_unofficial.device.Device] = self.coordinator.data
-        return next(
-            (d for d in data if d.serial_number == self._device.serial_number),
-            None,
-        )
+        return self.coordinator.get_device(self._serial)
 
     def _get_door_status(self) -> str | None:
         """Get the current door status."""
@@ -75,61 +82,59 @@ class NomaIQGarageDoorOpenerEntity(CoverEntity):
         return device.get_property_value("door_status") if device else None
 
     def _update_transition_state(self) -> None:
-        """Update the transition state based on current door status."""
-        door_status = self._get_door_status()
-        if door_status in ["opening", "closing"]:
-            self.coordinator.set_device_transition_state(
-                self._device.serial_number, True
-            )
-        else:
-            self.coordinator.set_device_transition_state(
-                self._device.serial_number, False
-            )
+        """Update the transition state based on current door status.
+
+        Only a moving door is put in transition here. Completion is left to the
+        coordinator, which ends the transition once a refresh reports the door
+        opened or closed.
+        """
+        if self._door_status in ["opening", "closing"]:
+            self.coordinator.set_device_transition_state(self._serial, True)
 
     @property
     def is_closed(self) -> bool | None:
         """Return True if door is closed."""
-        door_status = self._get_door_status()
-        return door_status == "closed"
+        return self._door_status == "closed"
 
     @property
     def is_closing(self) -> bool | None:
         """Return True if door is closing."""
-        door_status = self._get_door_status()
-        return door_status == "closing"
+        return self._door_status == "closing"
 
     @property
     def is_opening(self) -> bool | None:
         """Return True if door is opening."""
-        door_status = self._get_door_status()
-        return door_status == "opening"
+        return self._door_status == "opening"
+
+    async def _toggle(self) -> None:
+        """Toggle the door, dropping presses within the debounce window."""
+        now = self.hass.loop.time()
+        if now - self._last_toggle_ts < TOGGLE_DEBOUNCE_WINDOW:
+            return
+        self._last_toggle_ts = now
 
-    async def async_open_cover(self, **kwargs: Any) -> None:
-        """Open the door."""
         await self._device.async_set_property_value(
             "door_toggle", str(int(time.time()))
         )
         # Notify coordinator that device is entering transition state
-        self.coordinator.set_device_transition_state(self._device.serial_number, True)
+        self.coordinator.set_device_transition_state(self._serial, True)
+        await self.coordinator.async_request_refresh()
+
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        """Open the door."""
+        await self._toggle()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the door."""
-        await self._device.async_set_property_value(
-            "door_toggle", str(int(time.time()))
-        )
-        # Notify coordinator that device is entering transition state
-        self.coordinator.set_device_transition_state(self._device.serial_number, True)
+        await self._toggle()
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the door."""
-        await self._device.async_set_property_value(
-            "door_toggle", str(int(time.time()))
-        )
-        # Notify coordinator that device is entering transition state
-        self.coordinator.set_device_transition_state(self._device.serial_number, True)
+        await self._toggle()
 
-    async def async_update(self) -> None:
-        """Update the door state."""
-        await self.coordinator.async_request_refresh()
-        # Update transition state after refresh
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the door state from the coordinator."""
+        self._door_status = self._get_door_status()
         self._update_transition_state()
+        self.async_write_ha_state()
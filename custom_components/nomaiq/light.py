@@ -1,8 +1,10 @@
 """Platform for NomaIQ light integration with full color, brightness, and temperature support."""
 
 from __future__ import annotations
-from typing import Any
+
+import asyncio
 import logging
+from typing import Any
 
 import ayla_iot_unofficial.device
 
@@ -10,6 +12,7 @@ from homeassistant.components.light import ColorMode, LightEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import NomaIQConfigEntry
 from .const import DOMAIN
@@ -17,6 +20,30 @@ from .coordinator import NomaIQDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device brightness and color temperature are 0-100, HA uses 0-255 and mireds
+_MAX_BRIGHTNESS = 255
+_MIN_MIREDS = 153
+_MAX_MIREDS = 500
+_MIREDS_SCALE = (_MAX_MIREDS - _MIN_MIREDS) / 100
+
+# Color temperature lookup tables, device value (0-100) <-> mireds
+_DEVICE_TO_MIREDS = tuple(int(_MIN_MIREDS + (100 - val) * _MIREDS_SCALE) for val in range(101))
+_MIREDS_TO_DEVICE = tuple(
+    int(100 - (mireds - _MIN_MIREDS) / _MIREDS_SCALE)
+    for mireds in range(_MIN_MIREDS, _MAX_MIREDS + 1)
+)
+
+# Supported color modes, keyed by (supports color temperature, supports color)
+_MODES_BASE = frozenset({ColorMode.ONOFF, ColorMode.BRIGHTNESS})
+_MODES_WHITE = _MODES_BASE | {ColorMode.COLOR_TEMP}
+_MODES_COLOR = _MODES_BASE | {ColorMode.HS}
+_SUPPORTED_COLOR_MODES = {
+    (False, False): _MODES_BASE,
+    (True, False): _MODES_WHITE,
+    (False, True): _MODES_COLOR,
+    (True, True): _MODES_WHITE | _MODES_COLOR,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,29 +53,31 @@ async def async_setup_entry(
     """Set up the Noma IQ Light platform."""
     coordinator: NomaIQDataUpdateCoordinator = entry.runtime_data
 
-    for device in coordinator.data:
-        if "power" in device.properties_full and "voice_data" in device.properties_full:
-            async_add_entities(
-                [NomaIQLightEntity(coordinator, device)], update_before_add=False
-            )
+    async_add_entities(
+        (
+            NomaIQLightEntity(coordinator, device)
+            for device in coordinator.data.devices.values()
+            if "power" in device.properties_full and "voice_data" in device.properties_full
+        ),
+        update_before_add=False,
+    )
 
 
-class NomaIQLightEntity(LightEntity):
-    """Representation of a NomaIQ Light with optimistic updates."""
+class NomaIQLightEntity(CoordinatorEntity[NomaIQDataUpdateCoordinator], LightEntity):
+    """Representation of a NomaIQ Light."""
 
     def __init__(self, coordinator: NomaIQDataUpdateCoordinator, device: ayla_iot_unofficial.device.Device) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._device = device
+        self._serial: str = device.serial_number
 
         # Device capabilities
         self._is_color = "color_select" in device.properties_full and "color_saturation" in device.properties_full
         self._is_white_only = "color_temp" in device.properties_full
 
-        self._attr_supported_color_modes = {ColorMode.ONOFF, ColorMode.BRIGHTNESS}
-        if self._is_white_only:
-            self._attr_supported_color_modes.add(ColorMode.COLOR_TEMP)
-        if self._is_color:
-            self._attr_supported_color_modes.add(ColorMode.HS)
+        self._attr_supported_color_modes = _SUPPORTED_COLOR_MODES[
+            (self._is_white_only, self._is_color)
+        ]
 
         if self._is_color:
             self._attr_color_mode = ColorMode.HS
@@ -57,58 +86,50 @@ class NomaIQLightEntity(LightEntity):
         else:
             self._attr_color_mode = ColorMode.ONOFF
 
+        # Color mode reported for each device mode while the light is on
+        self._mode_map: dict[str, ColorMode] = {
+            "white": (
+                ColorMode.COLOR_TEMP if self._is_white_only or self._is_color else ColorMode.ONOFF
+            ),
+            "colour": ColorMode.HS if self._is_color else ColorMode.ONOFF,
+        }
+
         self._attr_name = device.get_property_value("voice_data") or device.name
-        self._attr_unique_id = f"nomaiq_light_{device.serial_number}"
+        self._attr_unique_id = f"nomaiq_light_{self._serial}"
         self._attr_has_entity_name = True
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.serial_number)},
+            identifiers={(DOMAIN, self._serial)},
             name=device.name,
         )
 
-        # Optimistic state
-        self._optimistic_is_on: bool | None = None
-        self._optimistic_brightness: int | None = None
-        self._optimistic_color_temp: int | None = None
-        self._optimistic_hs_color: tuple[float, float] | None = None
-
     def _get_device(self) -> ayla_iot_unofficial.device.Device | None:
-        return next(
-            (d for d in self.coordinator.data if d.serial_number == self._device.serial_number),
-            None,
-        )
+        return self.coordinator.get_device(self._serial)
 
     @property
     def is_on(self) -> bool | None:
-        return self._optimistic_is_on if self._optimistic_is_on is not None else (
-            self._get_device() and self._get_device().get_property_value("power")
-        )
+        device = self._get_device()
+        return device.get_property_value("power") if device else None
 
     @property
     def brightness(self) -> int | None:
-        if self._optimistic_brightness is not None:
-            return self._optimistic_brightness
         device = self._get_device()
         if device:
             val = device.get_property_value("brightness")
             if val is not None:
-                return int(val * 255 / 100)
+                return int(val * _MAX_BRIGHTNESS / 100)
         return None
 
     @property
     def color_temp(self) -> int | None:
-        if self._optimistic_color_temp is not None:
-            return self._optimistic_color_temp
         device = self._get_device()
         if device and device.get_property_value("mode") == "white":
             val = device.get_property_value("color_temp")
             if val is not None:
-                return int(153 + (100 - val) * (500 - 153) / 100)
+                return _DEVICE_TO_MIREDS[min(max(int(val), 0), 100)]
         return None
 
     @property
     def hs_color(self) -> tuple[float, float] | None:
-        if self._optimistic_hs_color:
-            return self._optimistic_hs_color
         device = self._get_device()
         if device and device.get_property_value("mode") == "colour":
             hue = device.get_property_value("color_select")
@@ -123,68 +144,77 @@ class NomaIQLightEntity(LightEntity):
         if not device or not device.get_property_value("power"):
             return ColorMode.ONOFF
         mode = device.get_property_value("mode") or "white"
-        if mode == "colour" and self._is_color:
-            return ColorMode.HS
-        elif mode == "white" and self._is_white_only:
-            return ColorMode.COLOR_TEMP
-        elif mode == "white" and self._is_color:
-            return ColorMode.COLOR_TEMP
-        else:
-            return ColorMode.ONOFF
+        return self._mode_map.get(mode, ColorMode.ONOFF)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn device on with optional color/brightness/temperature."""
-        _LOGGER.debug("Turning ON light %s with kwargs: %s", self._device.serial_number, kwargs)
+        _LOGGER.debug("Turning ON light %s with kwargs: %s", self._serial, kwargs)
 
-        # Update optimistic state
-        self._optimistic_is_on = True
-        if "brightness" in kwargs:
-            self._optimistic_brightness = kwargs["brightness"]
-        if "color_temp" in kwargs:
-            self._optimistic_color_temp = kwargs["color_temp"]
+        leading: dict[str, Any] = {"power": 1}
+        values: dict[str, Any] = {}
         if "hs_color" in kwargs:
-            self._optimistic_hs_color = kwargs["hs_color"]
-        self.async_write_ha_state()
-
+            hue, sat = kwargs["hs_color"]
+            leading["mode"] = "colour"
+            values["color_select"] = int(hue)
+            values["color_saturation"] = int(sat)
+        elif "color_temp" in kwargs:
+            leading["mode"] = "white"
+            mireds = min(max(int(kwargs["color_temp"]), _MIN_MIREDS), _MAX_MIREDS)
+            values["color_temp"] = _MIREDS_TO_DEVICE[mireds - _MIN_MIREDS]
+        if "brightness" in kwargs:
+            values["brightness"] = int(kwargs["brightness"] * 100 / _MAX_BRIGHTNESS)
+
+        # Only the values the device accepted are stored in the coordinator
+        written = await self._async_set_properties(leading, values)
+        if written:
+            self.coordinator.async_set_device_values(self._serial, written)
+
+    async def _async_set_properties(
+        self, leading: dict[str, Any], values: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Set properties and return the ones that were accepted.
+
+        The leading properties are set one at a time and in order, before any of
+        the others. The others are batched into one request when supported.
+        """
+        written: dict[str, Any] = {}
         try:
-            await self._device.async_set_property_value("power", 1)
-            if "brightness" in kwargs:
-                val = int(kwargs["brightness"] * 100 / 255)
-                await self._device.async_set_property_value("brightness", val)
-            if "hs_color" in kwargs:
-                hue, sat = kwargs["hs_color"]
-                await self._device.async_set_property_value("mode", "colour")
-                await self._device.async_set_property_value("color_select", int(hue))
-                await self._device.async_set_property_value("color_saturation", int(sat))
-            elif "color_temp" in kwargs:
-                await self._device.async_set_property_value("mode", "white")
-                val = int(100 - (kwargs["color_temp"] - 153) * 100 / (500 - 153))
-                await self._device.async_set_property_value("color_temp", val)
+            # Power and mode go first, the remaining properties depend on them
+            for name, value in leading.items():
+                await self._device.async_set_property_value(name, value)
+                written[name] = value
+            batched = (
+                await self.coordinator.async_set_device_properties(self._device, values)
+                if len(values) > 1
+                else None
+            )
         except Exception as e:
-            _LOGGER.error("Failed to turn on light %s: %s", self._device.serial_number, e)
-            self._optimistic_is_on = None
+            _LOGGER.error("Failed to turn on light %s: %s", self._serial, e)
+            return written
 
-        # Coordinator refresh optional; HA already shows the optimistic state
-        await self.coordinator.async_request_refresh()
+        if batched is not None:
+            written.update(batched)
+            return written
+
+        pending = list(values.items())
+        results = await asyncio.gather(
+            *(self._device.async_set_property_value(name, value) for name, value in pending),
+            return_exceptions=True,
+        )
+        for (name, value), result in zip(pending, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to set %s on light %s: %s", name, self._serial, result)
+            else:
+                written[name] = value
+        return written
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn device off."""
-        _LOGGER.debug("Turning OFF light %s", self._device.serial_number)
-        self._optimistic_is_on = False
-        self.async_write_ha_state()
+        _LOGGER.debug("Turning OFF light %s", self._serial)
 
         try:
             await self._device.async_set_property_value("power", 0)
         except Exception as e:
-            _LOGGER.error("Failed to send power=0 to %s: %s", self._device.serial_number, e)
-            self._optimistic_is_on = None
-
-        await self.coordinator.async_request_refresh()
-
-    async def async_update(self) -> None:
-        """Update the light state and clear optimistic values."""
-        self._optimistic_is_on = None
-        self._optimistic_brightness = None
-        self._optimistic_color_temp = None
-        self._optimistic_hs_color = None
-        await self.coordinator.async_request_refresh()
+            _LOGGER.error("Failed to send power=0 to %s: %s", self._serial, e)
+        else:
+            self.coordinator.async_set_device_values(self._serial, {"power": 0})